@@ -47,24 +47,26 @@ class TEXT_EDITOR_PT_GeoscriptTestingPanel(bpy.types.Panel):
     def draw(self, context):
         layout = self.layout
 
-        obj = context.object
+        col = layout.column()
+        col.label(text="Hello world!", icon="WORLD_DATA")
+        col.operator("geoscript.run_tests")
 
-        row = layout.row()
-        row.label(text="Hello world!", icon="WORLD_DATA")
 
-        row = layout.row()
-        row.operator("geoscript.run_tests")
+classes = (
+    GeoscriptTestingOperator,
+    TEXT_EDITOR_PT_GeoscriptTestingPanel,
+)
+
+register_classes, unregister_classes = bpy.utils.register_classes_factory(classes)
 
 
 def register():
-    bpy.utils.register_class(GeoscriptTestingOperator)
-    bpy.utils.register_class(TEXT_EDITOR_PT_GeoscriptTestingPanel)
+    register_classes()
     print("Registered Anatomy Re-engineering Framework Addon")
 
 
 def unregister():
-    bpy.utils.unregister_class(GeoscriptTestingOperator)
-    bpy.utils.unregister_class(TEXT_EDITOR_PT_GeoscriptTestingPanel)
+    unregister_classes()
     print("Unregistered Anatomy Re-engineering Framework Addon")
 
 
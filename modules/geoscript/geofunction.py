@@ -2,10 +2,23 @@
 
 import bpy
 
-from typing import List
+from typing import List, Optional
 from .nodetrees import GeometryNodeTree
 from .types import AbstractSocket, Scalar, Vector3, Boolean, Geometry
 
+# Socket classes of the outputs of a node group, by Blender socket type:
+_OUTPUT_SOCKET_TYPES = {
+    "VALUE": Scalar,
+    "INT": Scalar,
+    "BOOLEAN": Boolean,
+    "VECTOR": Vector3,
+    "GEOMETRY": Geometry,
+}
+
+# Maps the node tree name of each geometry function to the function's
+# qualified name:
+_registered_functions: dict[str, str] = {}
+
 
 class GeometryNodeFunction(GeometryNodeTree):
     """A wrapper to create geometry node trees."""
@@ -20,7 +33,7 @@ class GeometryNodeFunction(GeometryNodeTree):
         # Set node group to the node tree defined in this object:
         bl_node = node.get_bl_node()
         assert isinstance(bl_node, bpy.types.GeometryNodeGroup)
-        bl_node.node_tree = bpy.data.node_groups[self.get_registered_name()]
+        bl_node.node_tree = self.get_bl_tree()
 
         # Connect the arguments to the inputs of the new node:
         for index, socket in enumerate(args):
@@ -30,24 +43,16 @@ class GeometryNodeFunction(GeometryNodeTree):
         # for output in node.outputs:
         output_list: List[object] = []
         for index, output in enumerate(bl_node.outputs):
-            if output.type == "VALUE":
-                output_list.append(Scalar(node, index))
-            elif output.type == "INT":
-                output_list.append(Scalar(node, index))
-            elif output.type == "BOOLEAN":
-                output_list.append(Boolean(node, index))
-            elif output.type == "VECTOR":
-                output_list.append(Vector3(node, index))
-            elif output.type == "GEOMETRY":
-                output_list.append(Geometry(node, index))
-            else:
+            socket_class = _OUTPUT_SOCKET_TYPES.get(output.type)
+            if socket_class is None:
                 raise ValueError(
                     "Unknown output type detected while adding"
                     " node group. This is likely a bug, please report to"
                     " the developers."
                 )
+            output_list.append(socket_class(node, index))
 
-        if len(output_list) == 0:
+        if not output_list:
             return None
         elif len(output_list) == 1:
             return output_list[0]
@@ -67,56 +72,105 @@ def generate_unique_name(f):
     return unique_name
 
 
-def geometry_function(f):
-    """Function decorator that generates a geoscript."""
+def generate_script(f, unique_name: str) -> GeometryNodeFunction:
+    """Generates the node tree of a geometry function.
 
-    def _geometry_function(*args, **kwargs):
+    Args:
+        f:
+            The function decorated by @geometry_function.
+        unique_name:
+            The name under which the node tree is registered in Blender.
 
-        inputs = []
-
-        # Register a new GeometryNodeTree with a unique name:
-        unique_name = generate_unique_name(f)
-        script = GeometryNodeFunction(unique_name)
-
-        # TODO: Detect if the node tree already is registered.
-
-        # Detect the required node inputs from the function's arguments list:
-        for name in f.__annotations__:
-            annotation = f.__annotations__[name]
-
-            if name == "return":
-                continue
-
-            # Add the node input:
-            if annotation == Scalar or annotation == Scalar | float:
-                inputs.append(script.InputFloat(name))
-            elif annotation == Vector3:
-                inputs.append(script.InputVector(name))
-            elif annotation == Geometry:
-                inputs.append(script.InputGeometry(name))
-            else:
-                raise TypeError(
-                    "Geometry functions must have arguments"
-                    " of type Scalar, Vector3, Geometry. Arguments of"
-                    " type {} are not supported.".format(annotation)
-                )
+    Returns:
+        A GeometryNodeFunction containing the generated node tree.
+    """
+    inputs = []
+
+    # Register a new GeometryNodeTree with a unique name:
+    script = GeometryNodeFunction(unique_name)
+
+    # Detect the required node inputs from the function's arguments list:
+    for name in f.__annotations__:
+        annotation = f.__annotations__[name]
+
+        if name == "return":
+            continue
+
+        # Add the node input:
+        if annotation == Scalar or annotation == Scalar | float:
+            inputs.append(script.InputFloat(name))
+        elif annotation == Vector3:
+            inputs.append(script.InputVector(name))
+        elif annotation == Geometry:
+            inputs.append(script.InputGeometry(name))
+        else:
+            raise TypeError(
+                "Geometry functions must have arguments"
+                " of type Scalar, Vector3, Geometry. Arguments of"
+                f" type {annotation} are not supported."
+            )
 
-        # TODO: Raise error when there is an argument that isn't annotated.
+    # TODO: Raise error when there is an argument that isn't annotated.
 
-        # Generate the node tree:
-        output = f(*inputs)
+    # Generate the node tree:
+    output = f(*inputs)
 
-        # Add the node output:
-        if isinstance(output, Scalar):
-            script.OutputFloat(output, name)
-        elif isinstance(output, Vector3):
-            script.OutputVector(output, name)
-        elif isinstance(output, Boolean):
-            script.OutputBoolean(output, name)
-        elif isinstance(output, Geometry):
-            script.OutputGeometry(output, name)
+    # Add the node output:
+    if isinstance(output, Scalar):
+        script.OutputFloat(output, name)
+    elif isinstance(output, Vector3):
+        script.OutputVector(output, name)
+    elif isinstance(output, Boolean):
+        script.OutputBoolean(output, name)
+    elif isinstance(output, Geometry):
+        script.OutputGeometry(output, name)
 
-        script.beautify_node_tree()
+    script.beautify_node_tree()
+
+    return script
+
+
+def has_missing_node_groups(bl_tree: bpy.types.GeometryNodeTree) -> bool:
+    """Returns whether a group node in the node tree has lost its node group."""
+    return any(
+        node.bl_idname == "GeometryNodeGroup" and node.node_tree is None
+        for node in bl_tree.nodes
+    )
+
+
+def geometry_function(f):
+    """Function decorator that generates a geoscript."""
+
+    # The node tree only depends on the decorated function, not on the
+    # arguments of a call, so it is generated once and shared by all calls:
+    unique_name = generate_unique_name(f)
+    script: Optional[GeometryNodeFunction] = None
+
+    # Long names are truncated, so two functions can map to the same node tree.
+    # Sharing a tree would make one function silently call the other:
+    qualified_name = f.__module__ + "." + f.__qualname__
+    registered_name = _registered_functions.setdefault(unique_name, qualified_name)
+    if registered_name != qualified_name:
+        raise ValueError(
+            f"Geometry functions {registered_name} and {qualified_name} both"
+            f' map to the node tree name "{unique_name}". Please rename one of'
+            " them."
+        )
+
+    def _geometry_function(*args, **kwargs):
+        nonlocal script
+
+        # Regenerate the node tree if it was never generated, if the registered
+        # node group is no longer the generated tree (e.g. because it was
+        # removed or another file was loaded), or if a geometry function it
+        # calls had its node group removed, which leaves an empty group node:
+        registered_tree = bpy.data.node_groups.get(unique_name)
+        if (
+            script is None
+            or registered_tree != script.get_bl_tree()
+            or has_missing_node_groups(registered_tree)
+        ):
+            script = generate_script(f, unique_name)
 
         # Return a handle to the geometry script, which is callable. When the
         # script is called using __call__, it returns a handle to a newly
@@ -244,6 +244,8 @@ class GeometryNodeTree:
     class GeometryNodeAttributes:
         """Standard input attributes for GeometryNodeTree"""
 
+        __slots__ = ("bl_node_tree",)
+
         def __init__(self, bl_node_tree: bpy.types.GeometryNodeTree):
             self.bl_node_tree = bl_node_tree
 
@@ -0,0 +1,68 @@
+#!/usr/bin/python3
+
+import bpy
+from ..nodetrees import GeometryNodeTree
+from ..types import abstract_socket
+from ..types.abstract_socket import NodeHandle
+
+
+class FloatSocketStub:
+    """Stands in for a float input socket and counts writes to its default value."""
+
+    type = "VALUE"
+
+    def __init__(self, default_value: float):
+        self._default_value = default_value
+        self.writes = 0
+
+    @property
+    def default_value(self) -> float:
+        return self._default_value
+
+    @default_value.setter
+    def default_value(self, value: float) -> None:
+        self._default_value = value
+        self.writes += 1
+
+
+class NodeStub:
+    """Stands in for a node with the given input sockets."""
+
+    def __init__(self, inputs):
+        self.inputs = inputs
+
+
+def test_connect_bool_to_boolean_math() -> None:
+    """Tests whether a bool constant is written to a Boolean Math input."""
+    tree = GeometryNodeTree("test_connect_argument")
+    output = tree.InputBoolean() & True
+
+    bl_node = output.socket_reference.node
+    assert bl_node.bl_idname == "FunctionNodeBooleanMath"
+    assert bl_node.inputs[0].is_linked
+    assert bl_node.inputs[1].default_value is True
+
+
+def test_connect_bool_to_int_socket() -> None:
+    """Tests whether a bool constant is written to an int input as 1."""
+    tree = GeometryNodeTree("test_connect_argument")
+    node_handle = tree.attributes.add_node("FunctionNodeRandomValue")
+
+    bl_input = node_handle.get_bl_node().inputs[8]
+    assert isinstance(bl_input, bpy.types.NodeSocketInt)
+    node_handle.connect_argument(8, True)
+    assert bl_input.default_value == 1
+
+
+def test_connect_float_equal_to_default(monkeypatch) -> None:
+    """Tests whether a float equal to the current default value is not rewritten."""
+    monkeypatch.setattr(abstract_socket, "_FLOAT_SOCKET_TYPES", (FloatSocketStub,))
+    bl_input = FloatSocketStub(0.5)
+    node_handle = NodeHandle(None, NodeStub([bl_input]))
+
+    node_handle.connect_argument(0, 0.5)
+    assert bl_input.writes == 0
+
+    node_handle.connect_argument(0, 2.0)
+    assert bl_input.writes == 1
+    assert bl_input.default_value == 2.0
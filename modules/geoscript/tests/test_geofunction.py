@@ -0,0 +1,94 @@
+#!/usr/bin/python3
+
+import pytest
+import bpy
+from ..geofunction import geometry_function
+from ..nodetrees import GeometryNodeTree
+from ..types import Scalar
+
+
+@geometry_function
+def double(value: Scalar) -> Scalar:
+    return value * 2.0
+
+
+def make_function(qualname: str):
+    """Creates an undecorated geometry function with the given __qualname__."""
+    def function(value: Scalar) -> Scalar:
+        return value * 2.0
+
+    function.__qualname__ = qualname
+    return function
+
+
+def test_geometry_function_reuses_node_tree() -> None:
+    """Tests whether a second call reuses the node tree without regenerating it."""
+    calls = []
+
+    @geometry_function
+    def counted(value: Scalar) -> Scalar:
+        calls.append(value)
+        return value * 2.0
+
+    tree = GeometryNodeTree("test_geometry_function")
+    value = tree.InputFloat()
+
+    first_group = counted(value).socket_reference.node.node_tree
+    second_group = counted(value).socket_reference.node.node_tree
+    assert len(calls) == 1
+    assert isinstance(first_group, bpy.types.GeometryNodeTree)
+    assert second_group == first_group
+    assert second_group.name == first_group.name
+
+
+def test_geometry_function_rebuilds_removed_node_tree() -> None:
+    """Tests whether a call regenerates the node tree after it was removed."""
+    tree = GeometryNodeTree("test_geometry_function")
+    value = tree.InputFloat()
+
+    group = double(value).socket_reference.node.node_tree
+    name = group.name
+    bpy.data.node_groups.remove(group)
+    assert bpy.data.node_groups.get(name) is None
+
+    rebuilt_group = double(value).socket_reference.node.node_tree
+    assert isinstance(rebuilt_group, bpy.types.GeometryNodeTree)
+    assert bpy.data.node_groups.get(name) == rebuilt_group
+    assert len(rebuilt_group.outputs) == 1
+
+
+def test_geometry_function_rebuilds_removed_inner_node_tree() -> None:
+    """Tests whether a call regenerates the node tree after the node tree of a
+    geometry function called by it was removed."""
+
+    @geometry_function
+    def inner(value: Scalar) -> Scalar:
+        return value * 2.0
+
+    @geometry_function
+    def outer(value: Scalar) -> Scalar:
+        return inner(value) + 1.0
+
+    def get_group_nodes(group: bpy.types.GeometryNodeTree):
+        return [node for node in group.nodes if node.bl_idname == "GeometryNodeGroup"]
+
+    tree = GeometryNodeTree("test_geometry_function")
+    value = tree.InputFloat()
+
+    group = outer(value).socket_reference.node.node_tree
+    (inner_node,) = get_group_nodes(group)
+    inner_name = inner_node.node_tree.name
+    bpy.data.node_groups.remove(inner_node.node_tree)
+
+    group = outer(value).socket_reference.node.node_tree
+    (inner_node,) = get_group_nodes(group)
+    assert inner_node.node_tree is not None
+    assert inner_node.node_tree == bpy.data.node_groups.get(inner_name)
+
+
+def test_geometry_function_name_collision() -> None:
+    """Tests whether functions whose truncated names collide are rejected."""
+    suffix = "_" + "x" * 80
+    geometry_function(make_function("first" + suffix))
+    with pytest.raises(ValueError):
+        geometry_function(make_function("second" + suffix))
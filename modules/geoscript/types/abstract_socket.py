@@ -3,10 +3,33 @@
 import bpy
 from typing import Optional, Sequence
 
+# Blender input socket types that accept constants of a given Python type:
+_FLOAT_SOCKET_TYPES = (
+    bpy.types.NodeSocketFloat,
+    bpy.types.NodeSocketFloatAngle,
+    bpy.types.NodeSocketFloatDistance,
+    bpy.types.NodeSocketFloatFactor,
+    bpy.types.NodeSocketFloatPercentage,
+    bpy.types.NodeSocketFloatTime,
+    bpy.types.NodeSocketFloatTimeAbsolute,
+    bpy.types.NodeSocketFloatUnsigned,
+)
+_INT_SOCKET_TYPES = (
+    bpy.types.NodeSocketInt,
+    bpy.types.NodeSocketIntFactor,
+    bpy.types.NodeSocketIntPercentage,
+    bpy.types.NodeSocketIntUnsigned,
+)
+# Bool constants can also be written to int sockets, as 1 or 0:
+_BOOL_SOCKET_TYPES = (bpy.types.NodeSocketBool,) + _INT_SOCKET_TYPES
+_STRING_SOCKET_TYPES = (bpy.types.NodeSocketString,)
+
 
 class NodeHandle:
     """A wrapper around a bpy.types.Node object."""
 
+    __slots__ = ("__node_tree", "__blender_node", "__layer")
+
     def __init__(
         self,
         node_tree: bpy.types.NodeTree,
@@ -52,53 +75,51 @@ class NodeHandle:
                 The object in input_list cannot connect to the node's socket,
                 due to being of the wrong type.
         """
-        node = self.get_bl_node()
-        tree = self.get_bl_tree()
-
-        socket_type = node.inputs[index].type
-        current_input = node.inputs[index]
-
+        node_inputs = self.__blender_node.inputs
+        current_input = node_inputs[index]
+        socket_type = current_input.type
+
+        # Writing an RNA property triggers a depsgraph update, so constants are
+        # only written when they differ from the input's current default value.
+        # bool is checked before int, because bool is a subclass of int and
+        # would otherwise never reach Bool sockets:
         if isinstance(socket, AbstractSocket):
             bl_idnames = socket.get_bl_idnames()
-            if node.inputs[index].type in bl_idnames:
-                tree.links.new(socket.socket_reference, node.inputs[index])
+            if socket_type in bl_idnames:
+                self.__node_tree.links.new(socket.socket_reference, current_input)
             else:
                 raise TypeError(
-                    "Argument {} of type {} doesn't support object"
-                    " of type {}.".format(index, socket_type, socket.__class__)
+                    f"Argument {index} of type {socket_type} doesn't support object"
+                    f" of type {socket.__class__}."
                 )
         elif isinstance(socket, float):
-            if isinstance(
-                current_input,
-                bpy.types.NodeSocketFloat
-                | bpy.types.NodeSocketFloatAngle
-                | bpy.types.NodeSocketFloatDistance
-                | bpy.types.NodeSocketFloatFactor
-                | bpy.types.NodeSocketFloatPercentage
-                | bpy.types.NodeSocketFloatTime
-                | bpy.types.NodeSocketFloatTimeAbsolute
-                | bpy.types.NodeSocketFloatUnsigned
+            if (
+                isinstance(current_input, _FLOAT_SOCKET_TYPES)
+                and current_input.default_value != socket
             ):
                 current_input.default_value = socket
-        elif isinstance(socket, int):
-            if isinstance(
-                current_input,
-                bpy.types.NodeSocketInt
-                | bpy.types.NodeSocketIntFactor
-                | bpy.types.NodeSocketIntPercentage
-                | bpy.types.NodeSocketIntUnsigned,
+        elif isinstance(socket, bool):
+            if (
+                isinstance(current_input, _BOOL_SOCKET_TYPES)
+                and current_input.default_value != socket
             ):
                 current_input.default_value = socket
-        elif isinstance(socket, bool):
-            if isinstance(current_input, bpy.types.NodeSocketBool):
+        elif isinstance(socket, int):
+            if (
+                isinstance(current_input, _INT_SOCKET_TYPES)
+                and current_input.default_value != socket
+            ):
                 current_input.default_value = socket
         elif isinstance(socket, str):
-            if isinstance(current_input, bpy.types.NodeSocketString):
+            if (
+                isinstance(current_input, _STRING_SOCKET_TYPES)
+                and current_input.default_value != socket
+            ):
                 current_input.default_value = socket
         elif socket is not None:
             raise TypeError(
-                "Argument {} of type {} doesn't support object"
-                " of type {}.".format(index, socket_type, socket.__class__)
+                f"Argument {index} of type {socket_type} doesn't support object"
+                f" of type {socket.__class__}."
             )
 
 
@@ -109,6 +130,8 @@ class AbstractSocket:
     This class is meant to be subclassed by socket types, such as Scalar,
     Vector3, Geometry, and so on."""
 
+    __slots__ = ("node_tree", "socket_reference", "layer")
+
     def __init__(
         self,
         node_handle: NodeHandle,
@@ -132,23 +155,39 @@ class AbstractSocket:
         return []
 
     @staticmethod
-    def __get_node_tree(socket_list: Sequence[object]) -> bpy.types.NodeTree:
-        """Extracts the Blender node tree from a list of AbstractSockets.
+    def __scan_inputs(
+        socket_list: Sequence[object], default_layer: int = 0
+    ) -> tuple[bpy.types.NodeTree, int]:
+        """Extracts the node tree and rightmost layer from a list of AbstractSockets.
 
         Extracts the bpy.types.GeometryNodeTree from a list of AbstractSockets,
         and ensures that all AbstractSockets in the list belong to that
         GeometryNodeTree. This prevents errors related to connecting nodes
         belonging to different node trees, which is impossible.
 
+        In the same pass, finds the layer index of the AbstractSocket in
+        socket_list that is positioned the furthest to the right in Blender's
+        visual node tree representation. The layer index helps to position the
+        node for display purposes. This is purely cosmetic, and the layer index
+        has no effect on the function of the nodes involved.
+
         Args:
             socket_list:
                 A list that contains at least one AbstractSocket. The other
                 entries can be any object or value, including None, and will be
                 ignored.
+            default_layer:
+                The layer that this function should return if no AbstractSocket
+                in socket_list is positioned further to the right.
 
         Returns:
-            The bpy.types.GeometryNodeTree that all AbstractSockets in
-            socket_list belong to.
+            A tuple containing (node_tree, max_layer):
+                node_tree:
+                    The bpy.types.GeometryNodeTree that all AbstractSockets in
+                    socket_list belong to.
+                max_layer:
+                    An int that represents the rightmost layer that an
+                    AbstractSocket inside socket_list is in.
 
         Raises:
             ValueError:
@@ -159,55 +198,27 @@ class AbstractSocket:
                 socket_list contains no AbstractSockets.
         """
         node_tree: Optional[bpy.types.NodeTree] = None
+        max_layer = default_layer
         for i in socket_list:
             if isinstance(i, AbstractSocket):
                 if node_tree is None:
                     node_tree = i.node_tree
-
-                if node_tree != i.node_tree:
+                elif node_tree != i.node_tree:
                     raise ValueError(
                         "Attempting to perform an operation on"
                         " nodes that belong to different node trees."
                     )
 
+                if i.layer > max_layer:
+                    max_layer = i.layer
+
         if node_tree is None:
             raise TypeError(
                 "Cannot add a new node to node tree without at"
                 " least one input connection."
             )
 
-        return node_tree
-
-    @staticmethod
-    def __get_outermost_layer(socket_list: Sequence[object], default: int = 0):
-        """Gets the visual layer position of rightmost AbstractSocket.
-
-        Finds the layer index of the AbstractSocket in socket_list that is
-        positioned the furthest to the right in Blender's visual node tree
-        representation. The layer index helps to position the node for display
-        purposes. This is purely cosmetic, and the layer index has no effect on
-        the function of the nodes involved.
-
-        Args:
-            socket_list:
-                A list that contains any amount of AbstractSocket. The other
-                entries can be any object or value, including None, and will
-                be ignored.
-            default:
-                The layer that this function should return if there are no
-                AbstractSockets in socket_list.
-
-        Returns:
-            An int that represents the rightmost layer that an AbstractSocket
-            inside socket_list is in, or the default value if there are no
-            AbstractSockets inside socket_list.
-        """
-        max_layer = default
-        for i in socket_list:
-            if isinstance(i, AbstractSocket):
-                max_layer = max(max_layer, i.layer)
-
-        return max_layer
+        return node_tree, max_layer
 
     @staticmethod
     def new_node(input_list, node_type: str = "") -> NodeHandle:
@@ -228,8 +239,7 @@ class AbstractSocket:
             the added node.
         """
         # First calculate which is the rightmost layer of the input sockets:
-        node_tree = AbstractSocket.__get_node_tree(input_list)
-        max_layer = AbstractSocket.__get_outermost_layer(input_list)
+        node_tree, max_layer = AbstractSocket.__scan_inputs(input_list)
 
         new_layer = max_layer + 1
 
@@ -271,6 +281,7 @@ class AbstractSocket:
                 due to being of the wrong type.
         """
         node_handle = AbstractSocket.new_node(input_list, node_type)
+        connect_argument = node_handle.connect_argument
         for index, socket in enumerate(input_list):
-            node_handle.connect_argument(index, socket)
+            connect_argument(index, socket)
         return node_handle
@@ -10,6 +10,8 @@ class AbstractTensor(AbstractSocket):
     operations can be performed.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def math_operation_unary(operand, operation: str = "ADD", use_clamp: bool = False):
         return NotImplemented
@@ -8,6 +8,8 @@ from .abstract_socket import AbstractSocket
 class Boolean(AbstractSocket):
     """A mathematics operation in a Geometry Node tree. Maps to a "Math" node."""
 
+    __slots__ = ()
+
     @staticmethod
     def get_bl_idnames():
         """Returns a list of Blender socket types that this class represents.
@@ -26,9 +28,9 @@ class Boolean(AbstractSocket):
 
     @staticmethod
     def math_operation_binary(left, right, operation: str = "ADD"):
-        if not isinstance(right, Boolean | bool):
+        if not isinstance(right, _BOOLEAN_OPERANDS):
             return NotImplemented
-        if not isinstance(left, Boolean | bool):
+        if not isinstance(left, _BOOLEAN_OPERANDS):
             return NotImplemented
         if isinstance(left, bool) and isinstance(right, bool):
             return NotImplemented
@@ -78,3 +80,7 @@ class Boolean(AbstractSocket):
     # Subtract:
     def __sub__(self, other):
         return self.math_operation_binary(self, other, operation="NIMPLY")
+
+
+# Operand types accepted by Boolean.math_operation_binary:
+_BOOLEAN_OPERANDS = (Boolean, bool)
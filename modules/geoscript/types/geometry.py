@@ -2,16 +2,77 @@
 
 import bpy
 
-from typing import Tuple
+from typing import NamedTuple
 from .abstract_socket import AbstractSocket, NodeHandle
 from .vector3 import Vector3
 from .scalar import Scalar
 from .boolean import Boolean
 
+# Blender node types (bl_idname) added by the Geometry methods:
+_SET_POSITION = "GeometryNodeSetPosition"
+_SET_ID = "GeometryNodeSetID"
+_PROXIMITY = "GeometryNodeProximity"
+_TRANSFORM = "GeometryNodeTransform"
+_SEPARATE_GEOMETRY = "GeometryNodeSeparateGeometry"
+_SEPARATE_COMPONENTS = "GeometryNodeSeparateComponents"
+_MERGE_BY_DISTANCE = "GeometryNodeMergeByDistance"
+_GEOMETRY_TO_INSTANCE = "GeometryNodeGeometryToInstance"
+_BOUND_BOX = "GeometryNodeBoundBox"
+_CONVEX_HULL = "GeometryNodeConvexHull"
+_RAYCAST = "GeometryNodeRaycast"
+
+# Input index of the attribute to sample on a "Raycast" node, by data type:
+_RAYCAST_ATTRIBUTE_INPUTS = {
+    "FLOAT": 2,
+    "INT": 5,
+    "FLOAT_VECTOR": 1,
+    "FLOAT_COLOR": 3,
+    "BOOLEAN": 4,
+}
+
+# Socket classes of the sampled attribute output of a "Raycast" node. Colors
+# are not supported yet:
+_RAY_HIT_ATTRIBUTE_TYPES = {
+    "VALUE": Scalar,  # "VALUE" means float in Blender.
+    "INT": Scalar,
+    "BOOLEAN": Boolean,
+    "VECTOR": Vector3,
+}
+
+
+class ClosestResult(NamedTuple):
+    """The closest position on a geometry and the distance to it."""
+
+    position: Vector3
+    distance: Scalar
+
+
+class BoundingBoxCorners(NamedTuple):
+    """The two opposite corners of a bounding box."""
+
+    minimum: Vector3
+    maximum: Vector3
+
+
+class SeparatedGeometry(NamedTuple):
+    """The two parts of a geometry after separating it by a selection."""
+
+    selected: "Geometry"
+    inverted: "Geometry"
+
 
 class Geometry(AbstractSocket):
     """Corresponds to a Geometry socket type in Blender's Geometry Nodes"""
 
+    __slots__ = ("_is_bound_box_output", "_components_node")
+
+    def __init__(self, node_handle: NodeHandle, output_index: int) -> None:
+        super().__init__(node_handle, output_index)
+
+        # Whether this socket is the geometry output of a "Bounding Box" node,
+        # which lets the bounding box methods reuse that node:
+        self._is_bound_box_output = False
+
     @staticmethod
     def get_bl_idnames():
         """Returns a list of Blender socket types that this class represents.
@@ -51,7 +112,7 @@ class Geometry(AbstractSocket):
             The geometry after the transformation.
         """
         arguments = [self, selection, position, offset]
-        node = AbstractSocket.add_linked_node(arguments, "GeometryNodeSetPosition")
+        node = AbstractSocket.add_linked_node(arguments, _SET_POSITION)
         return Geometry(node, 0)
 
     # "Set ID":
@@ -74,14 +135,14 @@ class Geometry(AbstractSocket):
             The geometry after the assignment of the IDs.
         """
         arguments = [self, selection, id]
-        node = AbstractSocket.add_linked_node(arguments, "GeometryNodeSetID")
+        node = AbstractSocket.add_linked_node(arguments, _SET_ID)
         return Geometry(node, 0)
 
     # "Geometry Proximity" in Blender:
     def __get_closest(
         self, target_element: str, source_position: Vector3 = None
-    ) -> Tuple[Vector3, Scalar]:
-        node = self.add_linked_node([self, source_position], "GeometryNodeProximity")
+    ) -> ClosestResult:
+        node = self.add_linked_node([self, source_position], _PROXIMITY)
 
         bl_node = node.get_bl_node()
         assert isinstance(bl_node, bpy.types.GeometryNodeProximity)
@@ -90,9 +151,9 @@ class Geometry(AbstractSocket):
         position = Vector3(node, 0)
         distance = Scalar(node, 1)
 
-        return position, distance
+        return ClosestResult(position, distance)
 
-    def get_closest_point(self, source_position: Vector3) -> Tuple[Vector3, Scalar]:
+    def get_closest_point(self, source_position: Vector3) -> ClosestResult:
         """Gets the vertex and distance closest to source_position.
 
         Args:
@@ -105,7 +166,7 @@ class Geometry(AbstractSocket):
                 One of the arguments is of the wrong type.
 
         Returns:
-            A tuple containing (position, distance):
+            A ClosestResult containing (position, distance):
                 position:
                     The position of the vertex in the geometry that is the
                     closest to source_position.
@@ -114,7 +175,7 @@ class Geometry(AbstractSocket):
         """
         return self.__get_closest("POINTS", source_position)
 
-    def get_closest_edge(self, source_position: Vector3) -> Tuple[Vector3, Scalar]:
+    def get_closest_edge(self, source_position: Vector3) -> ClosestResult:
         """Gets the edge position and distance closest to source_position.
 
         Args:
@@ -127,7 +188,7 @@ class Geometry(AbstractSocket):
                 One of the arguments is of the wrong type.
 
         Returns:
-            A tuple containing (position, distance):
+            A ClosestResult containing (position, distance):
                 position:
                     The position of the edge in the geometry that is the
                     closest to source_position.
@@ -136,7 +197,7 @@ class Geometry(AbstractSocket):
         """
         return self.__get_closest("EDGES", source_position)
 
-    def get_closest_face(self, source_position: Vector3) -> Tuple[Vector3, Scalar]:
+    def get_closest_face(self, source_position: Vector3) -> ClosestResult:
         """Gets the face position and distance closest to source_position.
 
         Args:
@@ -149,7 +210,7 @@ class Geometry(AbstractSocket):
                 One of the arguments is of the wrong type.
 
         Returns:
-            A tuple containing (position, distance):
+            A ClosestResult containing (position, distance):
                 position:
                     The position of the face in the geometry that is the
                     closest to source_position.
@@ -180,13 +241,13 @@ class Geometry(AbstractSocket):
             The geometry after the transformation.
         """
         arguments = [self, translation, rotation, scale]
-        node = AbstractSocket.add_linked_node(arguments, "GeometryNodeTransform")
+        node = AbstractSocket.add_linked_node(arguments, _TRANSFORM)
         return Geometry(node, 0)
 
     # "Separate Geometry" in Blender:
     def separate_geometry(
         self, selection: Boolean, domain: str = "POINT"
-    ) -> Tuple["Geometry", "Geometry"]:
+    ) -> SeparatedGeometry:
         """Separates the geometry into two parts using selection.
 
         Args:
@@ -203,23 +264,29 @@ class Geometry(AbstractSocket):
                 One of the arguments is of the wrong type.
 
         Returns:
-            The geometry after the transformation.
+            A SeparatedGeometry containing (selected, inverted):
+                selected:
+                    The elements where selection is True.
+                inverted:
+                    The elements where selection is False.
         """
         arguments = [self, selection]
-        node = AbstractSocket.add_linked_node(arguments, "GeometryNodeSeparateGeometry")
+        node = AbstractSocket.add_linked_node(arguments, _SEPARATE_GEOMETRY)
 
         selected = Geometry(node, 0)
         inverted = Geometry(node, 1)
 
-        return (selected, inverted)
+        return SeparatedGeometry(selected, inverted)
 
     # "Separate Component" in Blender:
     def __get_component(self, index: int):
-        if not hasattr(self, "_components_node"):
-            self._components_node = AbstractSocket.add_linked_node(
-                [self], "GeometryNodeSeparateComponents"
+        components_node = getattr(self, "_components_node", None)
+        if components_node is None:
+            components_node = AbstractSocket.add_linked_node(
+                [self], _SEPARATE_COMPONENTS
             )
-        return Geometry(self._components_node, index)
+            self._components_node = components_node
+        return Geometry(components_node, index)
 
     def get_mesh_component(self):
         """Isolate the mesh inside this geometry, if any."""
@@ -263,7 +330,7 @@ class Geometry(AbstractSocket):
             The geometry after the merging.
         """
         arguments = [self, selection, merge_distance]
-        node = AbstractSocket.add_linked_node(arguments, "GeometryNodeMergeByDistance")
+        node = AbstractSocket.add_linked_node(arguments, _MERGE_BY_DISTANCE)
         bl_node = node.get_bl_node()
         assert isinstance(bl_node, bpy.types.GeometryNodeMergeByDistance)
         bl_node.mode = "ALL"
@@ -290,7 +357,7 @@ class Geometry(AbstractSocket):
             The geometry after the merging.
         """
         arguments = [self, selection, merge_distance]
-        node = AbstractSocket.add_linked_node(arguments, "GeometryNodeMergeByDistance")
+        node = AbstractSocket.add_linked_node(arguments, _MERGE_BY_DISTANCE)
         bl_node = node.get_bl_node()
         assert isinstance(bl_node, bpy.types.GeometryNodeMergeByDistance)
         bl_node.mode = "CONNECTED"
@@ -306,16 +373,16 @@ class Geometry(AbstractSocket):
         Returns:
             A new Geometry that has internally been converted to instances.
         """
-        node = AbstractSocket.add_linked_node([self], "GeometryNodeGeometryToInstance")
+        node = AbstractSocket.add_linked_node([self], _GEOMETRY_TO_INSTANCE)
         return Geometry(node, 0)
 
     # "Bounding Box" in Blender:
     def __get_bounding_box_node(self) -> NodeHandle:
-        previous_node = self.socket_reference.node
-        if previous_node.bl_idname == "GeometryNodeBoundBox":
+        if self._is_bound_box_output:
+            previous_node = self.socket_reference.node
             return NodeHandle(self.node_tree, previous_node, self.layer)
         else:
-            return AbstractSocket.add_linked_node([self], "GeometryNodeBoundBox")
+            return AbstractSocket.add_linked_node([self], _BOUND_BOX)
 
     def get_bounding_box_geometry(self) -> "Geometry":
         """Gets the geometry of the bounding box.
@@ -324,19 +391,21 @@ class Geometry(AbstractSocket):
             A new Geometry that contains the bounding box.
         """
         node = self.__get_bounding_box_node()
-        return Geometry(node, 0)
+        bounding_box = Geometry(node, 0)
+        bounding_box._is_bound_box_output = True
+        return bounding_box
 
-    def get_bounding_box_points(self) -> Tuple[Vector3, Vector3]:
+    def get_bounding_box_points(self) -> BoundingBoxCorners:
         """Gets the positions of the corners of the bounding box.
 
         Returns:
-            A tuple containing the two opposite Vector3 points of the bounding
-            box.
+            A BoundingBoxCorners containing the two opposite Vector3 points
+            (minimum, maximum) of the bounding box.
         """
         node = self.__get_bounding_box_node()
         minimum = Vector3(node, 1)
         maximum = Vector3(node, 2)
-        return (minimum, maximum)
+        return BoundingBoxCorners(minimum, maximum)
 
     # "Convex Hull" in Blender:
     def get_convex_hull(self) -> "Geometry":
@@ -345,13 +414,15 @@ class Geometry(AbstractSocket):
         Returns:
             A new Geometry containing the convex hull mesh of this geometry.
         """
-        node = AbstractSocket.add_linked_node([self], "GeometryNodeConvexHull")
+        node = AbstractSocket.add_linked_node([self], _CONVEX_HULL)
         return Geometry(node, 0)
 
     # "Raycast" in Blender:
     class RayHit(NodeHandle):
         """The intersection point between a ray and a mesh, if hit."""
 
+        __slots__ = ()
+
         def is_hit(self) -> Boolean:
             """True only if the ray intersects the mesh it was casted to."""
             return Boolean(self, 0)
@@ -370,17 +441,10 @@ class Geometry(AbstractSocket):
 
         def attribute(self) -> Scalar | Boolean | Vector3 | None:
             """The value of the selected attribute stored on the mesh at the ray hit."""
-            if self.get_output(4).type == "VALUE":  # "VALUE" means float in Blender.
-                return Scalar(self, 4)
-            elif self.get_output(4).type == "INT":
-                return Scalar(self, 4)
-            elif self.get_output(4).type == "BOOLEAN":
-                return Boolean(self, 4)
-            elif self.get_output(4).type == "VECTOR":
-                return Vector3(self, 4)
-            elif self.get_output(4).type == "COLOR":
+            socket_class = _RAY_HIT_ATTRIBUTE_TYPES.get(self.get_output(4).type)
+            if socket_class is None:
                 return None
-            return None
+            return socket_class(self, 4)
 
     def raycast(
         self,
@@ -438,21 +502,12 @@ class Geometry(AbstractSocket):
         ]
 
         # Connect attribute nodes:
-        if attribute_data_type == "FLOAT":
-            arguments[2] = attribute
-        elif attribute_data_type == "INT":
-            arguments[5] = attribute
-        elif attribute_data_type == "FLOAT_VECTOR":
-            arguments[1] = attribute
-        elif attribute_data_type == "FLOAT_COLOR":
-            arguments[3] = attribute
-        elif attribute_data_type == "BOOLEAN":
-            arguments[4] = attribute
+        attribute_index = _RAYCAST_ATTRIBUTE_INPUTS.get(attribute_data_type)
+        if attribute_index is not None:
+            arguments[attribute_index] = attribute
 
         # Create node:
-        node = AbstractSocket.add_linked_node(
-            arguments, "GeometryNodeRaycast"
-        )
+        node = AbstractSocket.add_linked_node(arguments, _RAYCAST)
 
         # Set the Blender node's properties:
         bl_node = node.get_bl_node()
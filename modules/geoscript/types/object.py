@@ -11,6 +11,8 @@ from .geometry import Geometry
 class Object(AbstractSocket):
     """Corresponds to an Object socket type in Blender's Geometry Nodes"""
 
+    __slots__ = ()
+
     @staticmethod
     def get_bl_idnames():
         """Returns a list of Blender socket types that this class represents.
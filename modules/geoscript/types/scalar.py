@@ -14,6 +14,8 @@ from .boolean import Boolean
 class Scalar(AbstractTensor):
     """A scalar field within a Geoscript, which acts like `float`."""
 
+    __slots__ = ()
+
     @staticmethod
     def get_bl_idnames() -> list[str]:
         """Returns a list of Blender socket types that this class represents.
@@ -3,7 +3,7 @@
 import bpy
 
 from typing import Union
-from .abstract_socket import AbstractSocket
+from .abstract_socket import AbstractSocket, NodeHandle
 from .abstract_tensor import AbstractTensor
 from .scalar import Scalar
 
@@ -11,6 +11,8 @@ from .scalar import Scalar
 class Vector3(AbstractTensor):
     """A 3D vector object in Geoscript."""
 
+    __slots__ = ("separate_xyz_node",)
+
     @staticmethod
     def get_bl_idnames() -> list[str]:
         """Returns a list of Blender socket types that this class represents.
@@ -76,23 +78,22 @@ class Vector3(AbstractTensor):
             return NotImplemented
 
     # Component getters:
-    def check_or_create_separation_node(self) -> None:
-        if not hasattr(self, "separate_xyz_node"):
+    def check_or_create_separation_node(self) -> NodeHandle:
+        node = getattr(self, "separate_xyz_node", None)
+        if node is None:
             node = self.new_node([self], "ShaderNodeSeparateXYZ")
             self.separate_xyz_node = node
             node.connect_argument(0, self)
+        return node
 
     @property
     def x(self) -> Scalar:
-        self.check_or_create_separation_node()
-        return Scalar(self.separate_xyz_node, 0)
+        return Scalar(self.check_or_create_separation_node(), 0)
 
     @property
     def y(self) -> Scalar:
-        self.check_or_create_separation_node()
-        return Scalar(self.separate_xyz_node, 1)
+        return Scalar(self.check_or_create_separation_node(), 1)
 
     @property
     def z(self) -> Scalar:
-        self.check_or_create_separation_node()
-        return Scalar(self.separate_xyz_node, 2)
+        return Scalar(self.check_or_create_separation_node(), 2)